@@ -1,20 +1,21 @@
+import asyncio
 import json
-import time
 import logging
+from concurrent.futures import ProcessPoolExecutor
 import os
 import re
 import requests
 import httpx
 import io
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from copy import copy
 from datetime import datetime, timezone, timedelta
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import html as lxml_html
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from pydantic import BaseModel
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from openpyxl import load_workbook
 from openpyxl.styles import Font, Border, Side, PatternFill, Alignment
 import zipfile
@@ -24,6 +25,36 @@ from docx import Document
 # LOGGING
 # ============================================================
 
+# orjson is 3-10x faster than stdlib json on the small blobs we decode
+# per request (VF djson, MST/HiFleet payloads). Fall back silently to
+# stdlib if it isn't installed — same pattern as curl_cffi below.
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+
+    def _json_loads(s):
+        return orjson.loads(s)
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _HAS_ORJSON = False
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj)
+
+# uvloop roughly halves event-loop overhead for the same handler code.
+# uvicorn[standard] ships it, so this makes the fast loop stick even when
+# the server is launched without --loop uvloop; the stdlib loop remains
+# the fallback where it isn't available.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s | %(levelname)-8s | %(message)s",
@@ -44,9 +75,13 @@ _USER_AGENTS = [
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
 ]
 
-def _make_headers(referer: str = "https://www.vesselfinder.com/") -> dict:
+# Header dicts are built once per (UA, referer) pair and reused — callers
+# get a shared dict, so they must not mutate it. UA rotation is preserved
+# by random.choice over the per-UA pool.
+
+def _build_headers(ua: str, referer: str) -> dict:
     return {
-        "User-Agent": random.choice(_USER_AGENTS),
+        "User-Agent": ua,
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
         "Accept-Language": "en-US,en;q=0.9",
         "Accept-Encoding": "gzip, deflate, br",
@@ -54,14 +89,21 @@ def _make_headers(referer: str = "https://www.vesselfinder.com/") -> dict:
         "DNT": "1",
     }
 
-def _make_mst_headers() -> dict:
-    """
-    Headers that closely mirror a real Chrome 120 top-level navigation to
-    myshiptracking.com.  The Sec-Fetch-* set is what Cloudflare's JS challenge
-    checks — without these the TLS fingerprint alone is not enough.
-    """
-    return {
-        "User-Agent": random.choice(_USER_AGENTS),
+_HEADER_POOLS: Dict[str, List[dict]] = {}
+
+def _make_headers(referer: str = "https://www.vesselfinder.com/") -> dict:
+    pool = _HEADER_POOLS.get(referer)
+    if pool is None:
+        pool = [_build_headers(ua, referer) for ua in _USER_AGENTS]
+        _HEADER_POOLS[referer] = pool
+    return random.choice(pool)
+
+# Headers that closely mirror a real Chrome 120 top-level navigation to
+# myshiptracking.com.  The Sec-Fetch-* set is what Cloudflare's JS challenge
+# checks — without these the TLS fingerprint alone is not enough.
+_MST_HEADERS_POOL = [
+    {
+        "User-Agent": ua,
         # Chrome sends this exact Accept string for document navigations
         "Accept": (
             "text/html,application/xhtml+xml,application/xml;"
@@ -79,12 +121,34 @@ def _make_mst_headers() -> dict:
         "Cache-Control": "max-age=0",
         "DNT": "1",
     }
+    for ua in _USER_AGENTS
+]
+
+def _make_mst_headers() -> dict:
+    return random.choice(_MST_HEADERS_POOL)
 
 HEADERS = _make_headers()
 
 MYSHIPTRACKING_URL = "https://www.myshiptracking.com/requests/vesselsonmaptempTTT.php"
 HIFLEET_POS_URL    = "https://www.hifleet.com/hifleetapi/getRecentshipsVesselByMmsisAction.do"
 
+# The MST map-tile filter blob is constant apart from maxyr, so serialize
+# it once at import instead of re-encoding the same dict per request
+# (maxyr only moves at New Year and the process restarts far more often).
+_MST_MAP_FILTERS_JSON = _json_dumps({
+    "vtypes": ",0,3,4,6,7,8,9,10,11,12,13", "ports": "1",
+    "minsog": 0, "maxsog": 60, "minsz": 0, "maxsz": 500,
+    "minyr": 1950, "maxyr": datetime.now().year, "status": "",
+    "mapflt_from": "", "mapflt_dest": "",
+})
+
+# Static half of the map-tile query string; per call only the four bbox
+# floats change, so everything else is built once here.
+_MST_MAP_PARAMS_STATIC = {
+    "type": "json", "zoom": 15, "selid": -1, "seltype": 0,
+    "timecode": -1, "filters": _MST_MAP_FILTERS_JSON,
+}
+
 API_SECRET         = os.getenv("API_SECRET", "")
 EQUASIS_EMAIL      = os.getenv("EQUASIS_EMAIL", "")
 EQUASIS_PASSWORD   = os.getenv("EQUASIS_PASSWORD", "")
@@ -92,11 +156,89 @@ EQUASIS_PASSWORD   = os.getenv("EQUASIS_PASSWORD", "")
 BATCH_MAX_WORKERS = 2
 BATCH_MAX_IMOS    = 50
 
+# Skip every position fallback when the VF fix is at most this old (min)
+# and already full precision — the fallbacks could not beat it.
+VF_FRESH_SKIP_MIN = 5
+
+# Shared pooled session for all plain-requests traffic (VF, MST map JSON,
+# HiFleet fallback). Keep-alive avoids paying a fresh TCP+TLS handshake
+# (~100-300 ms) on every lookup against the same few hosts. Equasis keeps
+# its own session because login state lives in its cookies.
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+))
+
 # ============================================================
 # FASTAPI APP + CORS
 # ============================================================
 
-app = FastAPI()
+# Responses are plain dicts of scalars, which orjson serialises several
+# times faster than the stdlib encoder; keep the stock JSONResponse when
+# orjson isn't installed (same fallback as _json_loads above). The hot
+# vessel endpoints construct this class directly, which also skips
+# FastAPI's jsonable_encoder walk over an already-serialisable dict.
+_JSON_RESPONSE = ORJSONResponse if _HAS_ORJSON else JSONResponse
+
+app = FastAPI(default_response_class=_JSON_RESPONSE)
+
+# Long-lived async client for the VF fetch and MST map JSON tier.
+# One pool per process, created on the running loop at startup. The
+# sync SESSION above stays for code that runs in worker threads
+# (curl_cffi tiers, HiFleet fallback, Equasis).
+HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+
+# Process pool for the CPU-bound VF page parse. Threads don't help here —
+# lxml holds the GIL during Python-level traversal — so a small pool of
+# worker processes gives real parallelism under concurrent load.
+PARSE_POOL: Optional[ProcessPoolExecutor] = None
+
+# Strong reference to the startup warm-up task — the loop only keeps a
+# weak one, so without this the task can be garbage-collected mid-flight.
+_WARMUP_TASK: Optional["asyncio.Task"] = None
+
+@app.on_event("startup")
+async def _open_http_client():
+    global HTTP_CLIENT, PARSE_POOL, _WARMUP_TASK
+    HTTP_CLIENT = httpx.AsyncClient(
+        timeout=20,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        follow_redirects=True,
+        # Multiplex concurrent requests to the same host over one TLS
+        # connection instead of opening a socket per request.
+        http2=True,
+    )
+    PARSE_POOL = ProcessPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+    # Warm the pool in the background so the first real lookup doesn't pay
+    # the VF TLS handshake or the SOF template download. Best-effort only —
+    # startup must not fail because an upstream is grumpy.
+    _WARMUP_TASK = asyncio.get_running_loop().create_task(_warm_upstreams())
+
+async def _warm_upstreams():
+    try:
+        await HTTP_CLIENT.get("https://www.vesselfinder.com/", timeout=10)
+        logger.info("Warm-up: VF connection established")
+    except Exception as e:
+        logger.debug(f"Warm-up: VF pre-connect failed: {e}")
+    try:
+        await get_sof_template()
+        logger.info("Warm-up: SOF template preloaded")
+    except Exception as e:
+        logger.debug(f"Warm-up: SOF template preload failed: {e}")
+
+@app.on_event("shutdown")
+async def _close_http_client():
+    global PARSE_POOL
+    if HTTP_CLIENT is not None:
+        await HTTP_CLIENT.aclose()
+    if PARSE_POOL is not None:
+        PARSE_POOL.shutdown(wait=False, cancel_futures=True)
+        PARSE_POOL = None
 
 app.add_middleware(
     CORSMiddleware,
@@ -113,13 +255,66 @@ app.add_middleware(
 class BatchRequest(BaseModel):
     imos: List[str]
 
+# ============================================================
+# PRECOMPILED REGEXES
+# ============================================================
+# All hot-path patterns compiled once at import. re caches compiled
+# patterns, but the cache lookup itself is paid on every call — these
+# run on every /vessel-full request.
+
+IMO_RE     = re.compile(r"^\d{7}$")
+MMSI_JS_RE = re.compile(r"MMSI\s*=\s*(\d+)")
+# Bytes twin of MMSI_JS_RE for scanning the undecoded VF response body.
+MMSI_JS_RE_B = re.compile(rb"MMSI\s*=\s*(\d+)")
+DRAUGHT_RE = re.compile(r"(?:draught|draft)\s+(?:of\s+)?(\d+(?:\.\d+)?)\s*m", re.IGNORECASE)
+HIFLEET_AGE_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(min|h|d)", re.IGNORECASE)
+
+# MST canvas_map_generate() extraction patterns (see the helpers below
+# for the shape of the JS call each one targets).
+MST_CANVAS_POS_RE = re.compile(
+    r'canvas_map_generate\s*\(\s*["\'][^"\']*["\']\s*,\s*[\d.]+\s*,'
+    r'\s*([+-]?\d+\.?\d*)\s*,\s*([+-]?\d+\.?\d*)\s*,'
+    r'\s*([+-]?\d+\.?\d*)\s*,\s*([+-]?\d+\.?\d*)'
+)
+MST_CANVAS_COG_RE = re.compile(
+    r"canvas_map_generate\s*\([^,]+,\s*[^,]+,\s*[^,]+,\s*[^,]+,\s*"
+    r"([+-]?\d+(?:\.\d+)?)\s*[,)]"
+)
+MST_CANVAS_COG_LOOSE_RE = re.compile(
+    r"canvas_map_generate\s*\(.*?(\b[0-2]?\d{1,2}(?:\.\d+)?\b)\s*[,)]",
+    re.DOTALL,
+)
+MST_REPORTED_ON_RE = re.compile(
+    r'reported\s+on\b.{0,60}?(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2})'
+)
+
 # ============================================================
 # UTILITY HELPERS
 # ============================================================
 
+def first_value(d: Dict[str, str], *keys: str) -> Optional[str]:
+    """
+    First non-empty value among key aliases — VF has renamed table labels
+    over the years, so several fields are read through alias chains.
+    Empty strings are treated as missing on purpose: a blank cell must not
+    mask a populated alias further down the chain.
+    """
+    for k in keys:
+        v = d.get(k)
+        if v:
+            return v
+    return None
+
 def count_decimals(val: Any) -> int:
     if val is None:
         return 0
+    if isinstance(val, float):
+        # %g never emits trailing zeros, so the strip/split pass the
+        # generic branch needs is skipped entirely on the common case
+        # (this runs up to 4x per position comparison).
+        s = f"{val:.10g}"
+        i = s.find(".")
+        return 0 if i < 0 else len(s) - i - 1
     s = str(val)
     if "." in s:
         return len(s.split(".")[-1].rstrip("0"))
@@ -178,46 +373,130 @@ def get_mst_age_minutes(ts: Optional[str]) -> int:
 
 def validate_imo(imo: str) -> bool:
     imo = str(imo).strip()
-    if not re.match(r'^\d{7}$', imo):
-        return False
-    try:
-        total = sum(int(imo[i]) * (7 - i) for i in range(6))
-        return int(imo[6]) == total % 10
-    except Exception:
+    if not IMO_RE.match(imo):
         return False
+    # Unrolled checksum — the regex guarantees exactly 7 digits, so the
+    # ord() math can't fail and no generator/int boxing is needed.
+    total = (
+        (ord(imo[0]) - 48) * 7 + (ord(imo[1]) - 48) * 6 + (ord(imo[2]) - 48) * 5
+        + (ord(imo[3]) - 48) * 4 + (ord(imo[4]) - 48) * 3 + (ord(imo[5]) - 48) * 2
+    )
+    return total % 10 == ord(imo[6]) - 48
 
 # ============================================================
 # HTML HELPERS – VESSELFINDER
 # ============================================================
 
-def extract_table_data(soup: BeautifulSoup, table_class: str) -> Dict[str, str]:
-    data: Dict[str, str] = {}
-    tables = soup.find_all(class_=table_class)
-    if not tables:
-        return data
+# Class substrings of the VF info tables the scraper reads. Matching is
+# substring-on-@class, same as the old per-class XPath contains() tests.
+_VF_TABLE_CLASSES = ("tpt1", "tptfix", "vessel-info-table", "aparams")
+
+
+def _in_dest_container(el: lxml_html.HtmlElement) -> bool:
+    """
+    True when el sits inside the destination row container. The original
+    selector was "div.vi__r1.vi__sbt a._npNa"; without the ancestor check
+    a stray _npNa anchor elsewhere on the page would win the pre-order
+    walk and silently become the destination.
+    """
+    parent = el.getparent()
+    while parent is not None:
+        if parent.tag == "div":
+            pcls = parent.get("class") or ""
+            if "vi__r1" in pcls and "vi__sbt" in pcls:
+                return True
+        parent = parent.getparent()
+    return False
+
+
+def collect_vf_nodes(tree: lxml_html.HtmlElement) -> Dict[str, Any]:
+    """
+    Single pre-order walk over the VF page collecting every node the
+    scraper needs. Previously each field ran its own full-tree
+    cssselect/XPath pass (8+ traversals of a ~300 KB document); this
+    dispatches on tag/class once per node instead.
+    """
+    nodes: Dict[str, Any] = {
+        "name": None, "dest": None, "info_icon": None, "flag_icon": None,
+        "djson": None, "scripts": [], "paras": [],
+        "tables": {c: [] for c in _VF_TABLE_CLASSES},
+    }
+    for el in tree.iter():
+        tag = el.tag
+        if not isinstance(tag, str):   # skip comments/PIs
+            continue
+        if tag == "script":
+            if el.text:
+                nodes["scripts"].append(el.text)
+            continue
+        cls = el.get("class") or ""
+        if tag == "h1":
+            if nodes["name"] is None and "title" in cls.split():
+                nodes["name"] = el
+        elif tag == "a":
+            if nodes["dest"] is None and "_npNa" in cls and _in_dest_container(el):
+                nodes["dest"] = el
+        elif tag == "svg":
+            if nodes["info_icon"] is None and "ttt1" in cls and "info" in cls.split():
+                nodes["info_icon"] = el
+        elif tag == "p":
+            nodes["paras"].append(el)
+        elif tag == "div":
+            if nodes["flag_icon"] is None and "title-flag-icon" in cls:
+                nodes["flag_icon"] = el
+            elif nodes["djson"] is None and el.get("id") == "djson":
+                nodes["djson"] = el
+        if cls:
+            for table_class in _VF_TABLE_CLASSES:
+                if table_class in cls:
+                    nodes["tables"][table_class].append(el)
+                    break
+    return nodes
+
+
+def extract_table_data(tables: List[lxml_html.HtmlElement]) -> Dict[str, str]:
+    """
+    Pull label/value pairs out of pre-collected VF info tables.
 
+    Runs on raw lxml nodes — each row is walked exactly once and its cells
+    are classified by class substring, replacing the old BS4 lambda
+    matchers and the pair of per-row XPath evaluations they became.
+    """
+    data: Dict[str, str] = {}
     for table in tables:
-        for row in table.find_all("tr"):
-            label_el = row.find(
-                class_=lambda x: x and ("tpc1" in x or "tpx1" in x or "n3" in x)
-            )
-            value_el = row.find(
-                class_=lambda x: x and ("tpc2" in x or "tpx2" in x or "v3" in x)
-            )
-            if not (label_el and value_el):
+        for row in table.xpath(".//tr"):
+            # One descendant walk per row instead of two XPath evaluations:
+            # classify each element by class substring and stop as soon as
+            # both the label and the value cell have been seen.
+            label_el = value_el = None
+            for el in row.iter():
+                cls = el.get("class")
+                if not cls:
+                    continue
+                if label_el is None and (
+                    "tpc1" in cls or "tpx1" in cls or "n3" in cls
+                ):
+                    label_el = el
+                elif value_el is None and (
+                    "tpc2" in cls or "tpx2" in cls or "v3" in cls
+                ):
+                    value_el = el
+                if label_el is not None and value_el is not None:
+                    break
+            if label_el is None or value_el is None:
                 continue
-            label_parts = [c.strip() for c in label_el.contents if isinstance(c, str)]
-            label = " ".join(label_parts).replace(":", "").strip()
-            value = value_el.get_text(strip=True)
+            # Direct text nodes only — mirrors the old `label_el.contents`
+            # filter so nested badge/tooltip spans don't pollute the label.
+            label_parts = [t.strip() for t in label_el.xpath("text()")]
+            label = " ".join(p for p in label_parts if p).replace(":", "").strip()
+            value = " ".join(value_el.text_content().split())
             if label:
                 data[label] = value
     return data
 
-def extract_mmsi(soup: BeautifulSoup, static_data: Dict[str, str]) -> Optional[str]:
-    for s in soup.find_all("script"):
-        if not s.string:
-            continue
-        m = re.search(r"MMSI\s*=\s*(\d+)", s.string)
+def extract_mmsi(scripts: List[str], static_data: Dict[str, str]) -> Optional[str]:
+    for script_text in scripts:
+        m = MMSI_JS_RE.search(script_text)
         if m:
             return m.group(1)
     if "MMSI" in static_data:
@@ -249,6 +528,31 @@ except ImportError:
     )
 
 
+import threading
+
+_CURL_LOCAL = threading.local()
+
+def _curl_session():
+    """
+    Thread-local curl_cffi session with Chrome 120 impersonation.
+
+    libcurl easy handles are not thread-safe and the curl tiers run via
+    asyncio.to_thread, so each worker thread keeps its own session —
+    cookies and TLS state then persist across lookups instead of paying
+    a fresh handshake per call.
+    """
+    s = getattr(_CURL_LOCAL, "session", None)
+    if s is None:
+        s = curl_requests.Session(impersonate="chrome120")
+        _CURL_LOCAL.session = s
+    return s
+
+
+# Only these subtrees of the MST vessel page are ever queried — the port
+# calls table and the inline scripts the COG fallback scans.
+_MST_STRAINER = SoupStrainer(["table", "script"])
+
+
 def _extract_cog_from_scripts(soup: BeautifulSoup) -> Optional[float]:
     """
     Extract Course Over Ground from the hidden canvas_map_generate() JS call.
@@ -267,11 +571,7 @@ def _extract_cog_from_scripts(soup: BeautifulSoup) -> Optional[float]:
 
         # Pattern A — explicit function call with at least 5 comma-separated args.
         # Skips 4 leading args (any chars) then captures the 5th numeric arg.
-        m = re.search(
-            r"canvas_map_generate\s*\([^,]+,\s*[^,]+,\s*[^,]+,\s*[^,]+,\s*"
-            r"([+-]?\d+(?:\.\d+)?)\s*[,)]",
-            raw,
-        )
+        m = MST_CANVAS_COG_RE.search(raw)
         if m:
             try:
                 return float(m.group(1))
@@ -280,11 +580,7 @@ def _extract_cog_from_scripts(soup: BeautifulSoup) -> Optional[float]:
 
         # Pattern B — looser: find "canvas_map_generate" then grab the first
         # 3-digit-ish number that looks like a heading (0–360).
-        m2 = re.search(
-            r"canvas_map_generate\s*\(.*?(\b[0-2]?\d{1,2}(?:\.\d+)?\b)\s*[,)]",
-            raw,
-            re.DOTALL,
-        )
+        m2 = MST_CANVAS_COG_LOOSE_RE.search(raw)
         if m2:
             try:
                 val = float(m2.group(1))
@@ -372,10 +668,9 @@ def get_myshiptracking_pos_html(mmsi: str) -> Optional[Dict[str, Any]]:
     url = f"https://www.myshiptracking.com/vessels/mmsi-{mmsi}"
 
     try:
-        response = curl_requests.get(
+        response = _curl_session().get(
             url,
             headers=_make_mst_headers(),
-            impersonate="chrome120",
             timeout=25,
             verify=True,
             allow_redirects=True,
@@ -395,7 +690,12 @@ def get_myshiptracking_pos_html(mmsi: str) -> Optional[Dict[str, Any]]:
         text = response.text
 
         # Parse the HTML once — used for both position and port calls.
-        soup = BeautifulSoup(text, "html.parser")
+        # Only tables (port calls) and scripts (COG fallback) are ever read
+        # from this page, so a SoupStrainer skips building the rest of the
+        # tree (~5x less parse work on MST's heavy pages). Stays on
+        # html.parser: the lxml tree builder ignores parse_only, and the
+        # strainer saves more here than the faster parser would.
+        soup = BeautifulSoup(text, "html.parser", parse_only=_MST_STRAINER)
 
         # ------------------------------------------------------------------
         # Primary extraction — canvas_map_generate() JS call
@@ -405,12 +705,7 @@ def get_myshiptracking_pos_html(mmsi: str) -> Optional[Dict[str, Any]]:
         # This is more reliable than scraping the HTML paragraphs which MST
         # restructures frequently.
         # ------------------------------------------------------------------
-        map_match = re.search(
-            r'canvas_map_generate\s*\(\s*["\'][^"\']*["\']\s*,\s*[\d.]+\s*,'
-            r'\s*([+-]?\d+\.?\d*)\s*,\s*([+-]?\d+\.?\d*)\s*,'
-            r'\s*([+-]?\d+\.?\d*)\s*,\s*([+-]?\d+\.?\d*)',
-            text,
-        )
+        map_match = MST_CANVAS_POS_RE.search(text)
         if map_match:
             lat = float(map_match.group(1))
             lon = float(map_match.group(2))
@@ -419,10 +714,7 @@ def get_myshiptracking_pos_html(mmsi: str) -> Optional[Dict[str, Any]]:
 
             # Timestamp lives in the SEO paragraph outside ft-info:
             # "as reported on <strong>2026-04-11 18:17</strong>"
-            time_match = re.search(
-                r'reported\s+on\b.{0,60}?(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2})',
-                text,
-            )
+            time_match = MST_REPORTED_ON_RE.search(text)
             last_pos_utc = time_match.group(1) if time_match else None
 
             # Extract port calls from the SAME already-downloaded HTML page.
@@ -485,14 +777,12 @@ def get_myshiptracking_pos_vessel_api(mmsi: str) -> Optional[Dict[str, Any]]:
         "X-Requested-With":  "XMLHttpRequest",
     }
     try:
-        resp = curl_requests.get(
-            url, headers=headers, impersonate="chrome120", timeout=10
-        )
+        resp = _curl_session().get(url, headers=headers, timeout=10)
         if resp.status_code == 200:
             if not resp.text.strip():
                 logger.debug(f"MST vessel API: empty response for MMSI {mmsi} — endpoint inactive")
                 return None
-            data = resp.json()
+            data = _json_loads(resp.content)
             # Normalise field names — MST has used both 'lng' and 'lon' historically
             lat = data.get("lat") or data.get("latitude")
             lon = data.get("lng") or data.get("lon") or data.get("longitude")
@@ -518,11 +808,72 @@ def get_myshiptracking_pos_vessel_api(mmsi: str) -> Optional[Dict[str, Any]]:
     return None
 
 
-def get_myshiptracking_pos_map_json(
+# One in-flight task per quantized bbox: vessels in the same area hit
+# the same map tile, so concurrent lookups share one HTTP round trip and
+# each caller scans the shared bytes for its own MMSI. Same single-flight
+# pattern as _INFLIGHT below, keyed by (lat, lon, pad) at 0.1° granularity
+# (well inside the ±0.9° default pad).
+_MST_BBOX_INFLIGHT: Dict[Tuple[float, float, float], "asyncio.Task[Optional[bytes]]"] = {}
+
+
+def _inflight_done(registry: Dict, key: Any, task: "asyncio.Task") -> None:
+    """Drop a finished single-flight task from its registry.
+
+    Also retrieves the exception so asyncio doesn't log a "never
+    retrieved" warning when every waiter was cancelled before the task
+    finished.
+    """
+    registry.pop(key, None)
+    if not task.cancelled():
+        task.exception()
+
+
+async def _do_fetch_mst_map_tile(
+    lat_f: float, lon_f: float, pad: float, client: httpx.AsyncClient
+) -> Optional[bytes]:
+    params = {
+        **_MST_MAP_PARAMS_STATIC,
+        "minlat": lat_f - pad,  "maxlat": lat_f + pad,
+        "minlon": lon_f - pad,  "maxlon": lon_f + pad,
+    }
+    r = await client.get(
+        MYSHIPTRACKING_URL,
+        params=params,
+        headers=_make_headers(referer="https://www.myshiptracking.com/"),
+        timeout=10,
+    )
+    if r.status_code != 200:
+        logger.warning(f"MST map JSON returned HTTP {r.status_code}")
+        return None
+    return r.content
+
+
+async def _fetch_mst_map_tile(
+    lat_f: float, lon_f: float, pad: float, client: httpx.AsyncClient
+) -> Optional[bytes]:
+    """Fetch one MST map-tile response, coalescing concurrent identical boxes."""
+    key = (round(lat_f, 1), round(lon_f, 1), pad)
+    pending = _MST_BBOX_INFLIGHT.get(key)
+    if pending is None:
+        # The fetch runs as its own task, not inside this request's
+        # coroutine: if the caller that started it disconnects, only its
+        # shielded await is cancelled — the shared fetch keeps going for
+        # the other waiters.
+        pending = asyncio.get_running_loop().create_task(
+            _do_fetch_mst_map_tile(lat_f, lon_f, pad, client)
+        )
+        _MST_BBOX_INFLIGHT[key] = pending
+        pending.add_done_callback(
+            lambda t, key=key: _inflight_done(_MST_BBOX_INFLIGHT, key, t)
+        )
+    return await asyncio.shield(pending)
+
+
+async def get_myshiptracking_pos_map_json(
     mmsi: str,
     center_lat: Optional[float],
     center_lon: Optional[float],
-    session: requests.Session,
+    client: httpx.AsyncClient,
     pad: float = 0.9,
 ) -> Optional[Dict[str, Any]]:
     """
@@ -538,36 +889,28 @@ def get_myshiptracking_pos_map_json(
     except (TypeError, ValueError):
         return None
 
-    current_year = datetime.now().year
-    params = {
-        "type":     "json",
-        "minlat":   lat_f - pad,  "maxlat": lat_f + pad,
-        "minlon":   lon_f - pad,  "maxlon": lon_f + pad,
-        "zoom":     15,  "selid": -1,  "seltype": 0,  "timecode": -1,
-        "filters":  json.dumps({
-            "vtypes": ",0,3,4,6,7,8,9,10,11,12,13", "ports": "1",
-            "minsog": 0, "maxsog": 60, "minsz": 0, "maxsz": 500,
-            "minyr": 1950, "maxyr": current_year, "status": "",
-            "mapflt_from": "", "mapflt_dest": "",
-        }),
-    }
     try:
-        r = session.get(
-            MYSHIPTRACKING_URL,
-            params=params,
-            headers=_make_headers(referer="https://www.myshiptracking.com/"),
-            timeout=10,
-        )
-        if r.status_code != 200:
-            logger.warning(f"MST map JSON returned HTTP {r.status_code} for MMSI {mmsi}")
+        content = await _fetch_mst_map_tile(lat_f, lon_f, pad, client)
+        if content is None:
             return None
 
-        lines = [l.strip() for l in r.text.splitlines() if l.strip()]
-        if len(lines) < 3:
-            return None
-
-        target = str(mmsi).strip()
-        for line in lines[2:]:
+        # Scan the raw bytes: the bbox response can hold hundreds of vessels
+        # and we want exactly one MMSI, so a bytes containment check skips
+        # almost every line without allocating str objects — only a
+        # candidate line gets decoded and split.
+        target   = str(mmsi).strip()
+        target_b = target.encode()
+        skipped  = 0
+        for raw_line in content.splitlines():
+            raw_line = raw_line.strip()
+            if not raw_line:
+                continue
+            if skipped < 2:          # first two non-blank lines are headers
+                skipped += 1
+                continue
+            if target_b not in raw_line:
+                continue
+            line  = raw_line.decode("utf-8", "replace")
             parts = line.split("\t") if "\t" in line else line.split()
             if len(parts) >= 7 and parts[2].strip() == target:
                 return {
@@ -597,6 +940,20 @@ def get_myshiptracking_pos_map_json(
 # downstream age-comparison decision logic (parse_mst_timestamp) keeps working.
 # ============================================================
 
+# Constant apart from the rotated UA — built once, shared, do not mutate.
+_HIFLEET_HEADERS_POOL = [
+    {
+        "User-Agent":       ua,
+        "Accept":           "application/json, text/javascript, */*; q=0.01",
+        "Accept-Language":  "en-US,en;q=0.9",
+        "Accept-Encoding":  "gzip, deflate, br",
+        "Referer":          "https://www.hifleet.com/",
+        "X-Requested-With": "XMLHttpRequest",
+    }
+    for ua in _USER_AGENTS
+]
+
+
 def parse_hifleet_age(age_str: str) -> int:
     """
     Convert HiFleet age strings to minutes.
@@ -605,18 +962,18 @@ def parse_hifleet_age(age_str: str) -> int:
     """
     if not age_str:
         return 999
-    m = re.match(r'(\d+(?:\.\d+)?)\s*(min|h|d)', age_str.lower())
+    # Case-insensitive regex instead of lowering the whole string — no
+    # per-call string allocation, and the first unit char disambiguates.
+    m = HIFLEET_AGE_RE.match(age_str)
     if not m:
         return 999
     val  = float(m.group(1))
-    unit = m.group(2)
-    if unit == "min":
+    unit = m.group(2)[0]
+    if unit in "mM":
         return int(val)
-    if unit == "h":
+    if unit in "hH":
         return int(val * 60)
-    if unit == "d":
-        return int(val * 1440)
-    return 999
+    return int(val * 1440)
 
 
 def get_hifleet_position(mmsi: str) -> Optional[Dict[str, Any]]:
@@ -634,26 +991,18 @@ def get_hifleet_position(mmsi: str) -> Optional[Dict[str, Any]]:
         return None
 
     params  = {"mmsis": mmsi, "i18n": "en", "_v": "5.4.335"}
-    headers = {
-        "User-Agent":       random.choice(_USER_AGENTS),
-        "Accept":           "application/json, text/javascript, */*; q=0.01",
-        "Accept-Language":  "en-US,en;q=0.9",
-        "Accept-Encoding":  "gzip, deflate, br",
-        "Referer":          "https://www.hifleet.com/",
-        "X-Requested-With": "XMLHttpRequest",
-    }
+    headers = random.choice(_HIFLEET_HEADERS_POOL)
 
     try:
         if CURL_CFFI_AVAILABLE:
-            resp = curl_requests.get(
+            resp = _curl_session().get(
                 HIFLEET_POS_URL,
                 params=params,
                 headers=headers,
-                impersonate="chrome120",
                 timeout=10,
             )
         else:
-            resp = requests.get(
+            resp = SESSION.get(
                 HIFLEET_POS_URL,
                 params=params,
                 headers=headers,
@@ -664,7 +1013,7 @@ def get_hifleet_position(mmsi: str) -> Optional[Dict[str, Any]]:
             logger.debug(f"HiFleet returned HTTP {resp.status_code} for MMSI {mmsi}")
             return None
 
-        data = resp.json()
+        data = _json_loads(resp.content)
         if data.get("status") != "1":
             logger.debug(
                 f"HiFleet status != 1 for MMSI {mmsi}: {data.get('status')}"
@@ -721,56 +1070,96 @@ def get_hifleet_position(mmsi: str) -> Optional[Dict[str, Any]]:
 # MAIN SCRAPER (VF primary + MST 3-tier fallback)
 # ============================================================
 
-def scrape_vf_full(imo: str, session: requests.Session) -> Dict[str, Any]:
-    url = f"https://www.vesselfinder.com/vessels/details/{imo}"
+def pick_best_position(candidates: List[Dict[str, Any]], label: str) -> Optional[Dict[str, Any]]:
+    """
+    Pick the best fallback candidate using the same recency+precision rule
+    that runs later for VF-vs-fallback (10-minute age tolerance, then
+    precision wins). Returns None when there are no candidates.
+    """
+    if not candidates:
+        return None
 
-    r = session.get(url, headers=_make_headers(), timeout=20)
+    best = candidates[0]
+    for c in candidates[1:]:
+        best_age  = get_mst_age_minutes(best.get("last_pos_utc"))
+        c_age     = get_mst_age_minutes(c.get("last_pos_utc"))
+        best_prec = count_decimals(best["lat"]) + count_decimals(best["lon"])
+        c_prec    = count_decimals(c["lat"]) + count_decimals(c["lon"])
+        if abs(c_age - best_age) <= 10:
+            if c_prec > best_prec:
+                best = c
+        elif c_age < best_age:
+            best = c
+
+    # Trace log so we can see who competed and who won
+    sources_log = ", ".join(
+        f"{c.get('ais_source')}"
+        f"(age={get_mst_age_minutes(c.get('last_pos_utc'))}m,"
+        f"p={count_decimals(c['lat']) + count_decimals(c['lon'])})"
+        for c in candidates
+    )
+    logger.info(
+        f"{label} | Fallback candidates [{len(candidates)}]: {sources_log} "
+        f"→ winner={best.get('ais_source')}"
+    )
+    return best
 
-    if r.status_code == 404:
-        logger.info(f"IMO {imo} returned 404 from VesselFinder")
-        return {"found": False, "imo": imo}
-    r.raise_for_status()
 
-    soup = BeautifulSoup(r.text, "html.parser")
+def parse_vf_page(html: bytes, imo: str) -> Dict[str, Any]:
+    """
+    CPU-bound half of scrape_vf_full: parse the VF details page and return
+    a plain (picklable) dict. No I/O and no shared-cache mutation in here —
+    it runs inside the parse process pool, which has its own module state.
 
-    name_el = soup.select_one("h1.title")
-    name = name_el.get_text(strip=True) if name_el else f"IMO {imo}"
-    dest_el = soup.select_one("div.vi__r1.vi__sbt a._npNa")
-    destination = dest_el.get_text(strip=True) if dest_el else ""
+    Takes the raw response bytes: libxml2 does the charset handling in C,
+    so the page is never decoded to a Python str.
+    """
+    # Raw lxml tree — one layer less Python wrapping per node than BS4, and
+    # the selector/XPath work below runs almost entirely in C.
+    tree = lxml_html.fromstring(html)
 
-    info_icon = soup.select_one("svg.ttt1.info")
-    last_pos_utc = info_icon["data-title"] if info_icon and info_icon.has_attr("data-title") else None
+    nodes = collect_vf_nodes(tree)
+
+    name = nodes["name"].text_content().strip() if nodes["name"] is not None else f"IMO {imo}"
+    destination = nodes["dest"].text_content().strip() if nodes["dest"] is not None else ""
+
+    last_pos_utc = nodes["info_icon"].get("data-title") if nodes["info_icon"] is not None else None
     logger.info(f"IMO {imo} | name={name} | last_pos_utc={last_pos_utc}")
 
-    tech_data      = extract_table_data(soup, "tpt1")
-    dims_data      = extract_table_data(soup, "tptfix")
-    ais_table_data = extract_table_data(soup, "vessel-info-table")
-    aparams_data   = extract_table_data(soup, "aparams")
+    tech_data      = extract_table_data(nodes["tables"]["tpt1"])
+    dims_data      = extract_table_data(nodes["tables"]["tptfix"])
+    ais_table_data = extract_table_data(nodes["tables"]["vessel-info-table"])
+    aparams_data   = extract_table_data(nodes["tables"]["aparams"])
     static_data    = {**tech_data, **dims_data, **ais_table_data, **aparams_data}
-    mmsi           = extract_mmsi(soup, static_data)
+    # One C-level scan of the raw HTML finds the JS "MMSI = ..." assignment
+    # in nearly every page; the per-script loop + table fallback only run
+    # on a miss.
+    mmsi_match     = MMSI_JS_RE_B.search(html)
+    mmsi           = mmsi_match.group(1).decode() if mmsi_match else extract_mmsi(nodes["scripts"], static_data)
 
-    draught_val = static_data.get("Current draught") or static_data.get("Draught")
+    draught_val = first_value(static_data, "Current draught", "Draught")
     if not draught_val:
-        match = re.search(r"(?:draught|draft)\s+(?:of\s+)?(\d+(?:\.\d+)?)\s*m", soup.get_text(), re.IGNORECASE)
-        if match:
-            draught_val = f"{match.group(1)} m"
+        # The prose fallback lives in VF's description paragraphs — regex
+        # only those instead of serializing the entire DOM to one string
+        # (~300 KB dump) for a single field. If no paragraph mentions a
+        # draught, there is nothing to find.
+        for para in nodes["paras"]:
+            match = DRAUGHT_RE.search(para.text_content())
+            if match:
+                draught_val = f"{match.group(1)} m"
+                break
 
     final_static_data = {
         "imo": imo,
         "vessel_name": name,
-        "ship_type": (
-            static_data.get("Ship Type")
-            or static_data.get("Ship type")
-            or static_data.get("Type")
-            or ""
-        ),
+        "ship_type": first_value(static_data, "Ship Type", "Ship type", "Type") or "",
         "flag": (
-            soup.select_one("div.title-flag-icon").get("title")
-            if soup.select_one("div.title-flag-icon") else None
+            nodes["flag_icon"].get("title")
+            if nodes["flag_icon"] is not None else None
         ),
         "mmsi": mmsi,
         "draught_m": draught_val or "",
-        "deadweight_t":      static_data.get("Deadweight") or static_data.get("DWT"),
+        "deadweight_t":      first_value(static_data, "Deadweight", "DWT"),
         "gross_tonnage":     static_data.get("Gross Tonnage"),
         "year_of_build":     static_data.get("Year of Build"),
         "length_overall_m":  static_data.get("Length Overall"),
@@ -778,18 +1167,95 @@ def scrape_vf_full(imo: str, session: requests.Session) -> Dict[str, Any]:
     }
 
     vf_lat = vf_lon = sog = cog = None
-    djson_div = soup.find("div", id="djson")
-    if djson_div and djson_div.has_attr("data-json"):
+    djson_raw = nodes["djson"].get("data-json") if nodes["djson"] is not None else None
+    if djson_raw:
         try:
-            ais = json.loads(djson_div["data-json"])
-            vf_lat = float(ais.get("ship_lat")) if ais.get("ship_lat") else None
-            vf_lon = float(ais.get("ship_lon")) if ais.get("ship_lon") else None
+            ais = _json_loads(djson_raw)
+            raw_lat = ais.get("ship_lat")
+            raw_lon = ais.get("ship_lon")
+            vf_lat = float(raw_lat) if raw_lat else None
+            vf_lon = float(raw_lon) if raw_lon else None
             sog    = ais.get("ship_sog")
             cog    = ais.get("ship_cog")
             logger.info(f"IMO {imo} | VF AIS: lat={vf_lat}, lon={vf_lon}, sog={sog}, cog={cog}")
         except Exception as e:
             logger.warning(f"IMO {imo} | Failed to parse djson AIS data: {e}")
 
+    return {
+        "name":         name,
+        "destination":  destination,
+        "last_pos_utc": last_pos_utc,
+        "static":       final_static_data,
+        "mmsi":         mmsi,
+        "vf_lat":       vf_lat,
+        "vf_lon":       vf_lon,
+        "sog":          sog,
+        "cog":          cog,
+    }
+
+
+# Backpressure on the VF fetch: bursts past this many concurrent page
+# loads just queue instead of thrashing the connection pool and tripping
+# VF's per-IP rate limiting. Kept under the pool's max_connections so
+# the other tiers never starve for sockets.
+_VF_SEM = asyncio.BoundedSemaphore(20)
+
+
+async def scrape_vf_full(imo: str, client: httpx.AsyncClient) -> Dict[str, Any]:
+    url = f"https://www.vesselfinder.com/vessels/details/{imo}"
+
+    # Warm-IMO overlap: when a prior scrape already told us the MMSI, fire
+    # the cheap position tiers now so they run concurrently with the VF
+    # fetch+parse instead of strictly after it (~one upstream RTT saved).
+    cached_mmsi = _IMO_MMSI_CACHE.get(imo)
+    early_tasks: Optional[tuple] = None
+    if cached_mmsi:
+        early_tasks = (
+            asyncio.create_task(asyncio.to_thread(get_myshiptracking_pos_vessel_api, cached_mmsi)),
+            asyncio.create_task(asyncio.to_thread(get_hifleet_position, cached_mmsi)),
+        )
+
+    try:
+        async with _VF_SEM:
+            r = await client.get(url, headers=_make_headers(), timeout=20)
+        if r.status_code != 404:
+            r.raise_for_status()
+    except BaseException:
+        if early_tasks:
+            for t in early_tasks:
+                t.cancel()
+        raise
+
+    if r.status_code == 404:
+        if early_tasks:
+            for t in early_tasks:
+                t.cancel()
+        logger.info(f"IMO {imo} returned 404 from VesselFinder")
+        return {"found": False, "imo": imo}
+
+    html = r.content
+
+    # The parse is pure CPU (lxml holds the GIL during Python-level
+    # traversal), so it runs in the parse pool: the event loop stays
+    # responsive and concurrent scrapes use more than one core.
+    loop = asyncio.get_running_loop()
+    if PARSE_POOL is not None:
+        parsed = await loop.run_in_executor(PARSE_POOL, parse_vf_page, html, imo)
+    else:
+        parsed = parse_vf_page(html, imo)
+
+    destination       = parsed["destination"]
+    last_pos_utc      = parsed["last_pos_utc"]
+    final_static_data = parsed["static"]
+    mmsi              = parsed["mmsi"]
+    vf_lat, vf_lon    = parsed["vf_lat"], parsed["vf_lon"]
+    sog, cog          = parsed["sog"], parsed["cog"]
+
+    # Cache writes stay on this side — pool workers see their own copy of
+    # module state.
+    if mmsi:
+        _IMO_MMSI_CACHE[imo] = mmsi
+
     # ========== POSITION FALLBACK — competitive multi-source selection ==========
     # Cheap JSON sources (MST vessel-by-MMSI API + HiFleet) are always tried.
     # Slower sources (MST map-tile JSON, MST HTML scrape) escalate only when
@@ -809,74 +1275,85 @@ def scrape_vf_full(imo: str, session: requests.Session) -> Dict[str, Any]:
     mst_port_calls: List[Dict] = []
     candidates: List[Dict[str, Any]] = []
 
+    vf_age       = get_vf_age_minutes(last_pos_utc)
+    vf_precision = count_decimals(vf_lat) + count_decimals(vf_lon)
     vf_good = (
         vf_lat is not None
         and vf_lon is not None
-        and get_vf_age_minutes(last_pos_utc) <= 30
-        and count_decimals(vf_lat) + count_decimals(vf_lon) >= 4
+        and vf_age <= 30
+        and vf_precision >= 4
+    )
+
+    # Hard short-circuit: a full-precision VF fix only minutes old wins the
+    # decision logic below in all but pathological cases, so don't pay for
+    # any fallback round trips at all. Tighter than vf_good (which only
+    # gates escalation past the cheap tiers): a rounded VF fix (< 4 decimals
+    # per axis) can still lose to MST on precision, so only skip the
+    # fallbacks when VF is both fresh AND at full precision.
+    vf_fresh = (
+        vf_good and vf_age <= VF_FRESH_SKIP_MIN and vf_precision >= 8
     )
+    if vf_fresh and early_tasks:
+        for t in early_tasks:
+            t.cancel()
+        early_tasks = None
 
     def _good_enough(c: Dict[str, Any]) -> bool:
         age  = get_mst_age_minutes(c.get("last_pos_utc"))
         prec = count_decimals(c["lat"]) + count_decimals(c["lon"])
         return age <= 30 and prec >= 4
 
-    if mmsi is not None:
-        # Cheap source — MST vessel-by-MMSI JSON
-        cand = get_myshiptracking_pos_vessel_api(mmsi)
-        if cand and cand.get("lat") is not None:
-            candidates.append(cand)
+    if early_tasks and cached_mmsi != mmsi:
+        # Stale mapping (vessel re-registered?) — drop the early results.
+        for t in early_tasks:
+            t.cancel()
+        early_tasks = None
 
-        # Cheap source — HiFleet public lookup (no auth)
-        cand = get_hifleet_position(mmsi)
-        if cand and cand.get("lat") is not None:
-            candidates.append(cand)
+    if mmsi is not None and not vf_fresh:
+        if early_tasks:
+            # Cheap tiers were fired before the VF fetch — just collect them.
+            for task in early_tasks:
+                try:
+                    cand = await task
+                except Exception as e:
+                    logger.debug(f"MMSI {mmsi} | early position task failed: {e}")
+                    cand = None
+                if cand and cand.get("lat") is not None:
+                    candidates.append(cand)
+        else:
+            # Cheap sources — MST vessel-by-MMSI JSON and the HiFleet public
+            # lookup are independent, so fetch them concurrently (curl_cffi
+            # is sync; each runs in a worker thread to keep the loop free).
+            for cand in await asyncio.gather(
+                asyncio.to_thread(get_myshiptracking_pos_vessel_api, mmsi),
+                asyncio.to_thread(get_hifleet_position, mmsi),
+                return_exceptions=True,
+            ):
+                if isinstance(cand, BaseException):
+                    logger.debug(f"MMSI {mmsi} | cheap position tier failed: {cand}")
+                    continue
+                if cand and cand.get("lat") is not None:
+                    candidates.append(cand)
 
         need_escalate = not vf_good and not any(_good_enough(c) for c in candidates)
 
         # Escalation — MST bounding-box map JSON (needs VF coords, often 403,
         # carries no timestamp so it can only win when nothing else has one)
         if need_escalate and vf_lat is not None and vf_lon is not None:
-            cand = get_myshiptracking_pos_map_json(mmsi, vf_lat, vf_lon, session)
+            cand = await get_myshiptracking_pos_map_json(mmsi, vf_lat, vf_lon, client)
             if cand and cand.get("lat") is not None:
                 candidates.append(cand)
                 need_escalate = not any(_good_enough(c) for c in candidates)
 
         # Escalation — MST full HTML scrape (slowest; ALSO yields port calls)
         if need_escalate:
-            html_result = get_myshiptracking_pos_html(mmsi)
+            html_result = await asyncio.to_thread(get_myshiptracking_pos_html, mmsi)
             if html_result:
                 mst_port_calls = html_result.pop("port_calls", [])
                 if html_result.get("lat") is not None:
                     candidates.append(html_result)
 
-    # Pick best candidate using the same recency+precision rule that runs later
-    # for VF-vs-fallback (10-minute age tolerance, then precision wins).
-    if candidates:
-        best = candidates[0]
-        for c in candidates[1:]:
-            best_age  = get_mst_age_minutes(best.get("last_pos_utc"))
-            c_age     = get_mst_age_minutes(c.get("last_pos_utc"))
-            best_prec = count_decimals(best["lat"]) + count_decimals(best["lon"])
-            c_prec    = count_decimals(c["lat"]) + count_decimals(c["lon"])
-            if abs(c_age - best_age) <= 10:
-                if c_prec > best_prec:
-                    best = c
-            elif c_age < best_age:
-                best = c
-        mst_data = best
-
-        # Trace log so we can see who competed and who won
-        sources_log = ", ".join(
-            f"{c.get('ais_source')}"
-            f"(age={get_mst_age_minutes(c.get('last_pos_utc'))}m,"
-            f"p={count_decimals(c['lat']) + count_decimals(c['lon'])})"
-            for c in candidates
-        )
-        logger.info(
-            f"IMO {imo} | Fallback candidates [{len(candidates)}]: {sources_log} "
-            f"→ winner={mst_data.get('ais_source')}"
-        )
+    mst_data = pick_best_position(candidates, f"IMO {imo}")
 
     # Pull the MST timestamp out before the decision so both ages are comparable.
     # We do NOT merge it into last_pos_utc yet — only do that if we actually use MST.
@@ -978,6 +1455,71 @@ def scrape_vf_full(imo: str, session: requests.Session) -> Dict[str, Any]:
         "port_calls": mst_port_calls,
     }
 
+# ============================================================
+# VESSEL CACHE
+# ============================================================
+# Static vessel data (name, flag, dimensions, MMSI) almost never
+# changes and positions only move every few minutes, so a short TTL
+# turns repeated lookups of hot IMOs into dict hits instead of full
+# two-host scrapes.
+
+from cachetools import TTLCache
+
+VESSEL_CACHE_TTL  = 60          # seconds — short enough to keep positions fresh
+_VESSEL_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=VESSEL_CACHE_TTL)
+
+# IMO→MMSI is effectively immutable (think DNS): a long TTL lets the
+# position-only fast path skip the VF page entirely for known vessels.
+_IMO_MMSI_CACHE: TTLCache = TTLCache(maxsize=16384, ttl=86400)
+
+# Negative cache: IMOs VF answered 404 for. Unknown vessels don't start
+# existing within the hour, and clients retrying a bad IMO otherwise pay
+# (and cost us) a full page fetch every 60 s when the main cache — which
+# only stores found vessels — expires.
+_NOT_FOUND_CACHE: TTLCache = TTLCache(maxsize=8192, ttl=3600)
+
+# One in-flight task per IMO: N concurrent misses for the same vessel
+# collapse into a single scrape instead of hammering VF N times
+# (cache-stampede protection, and keeps us under VF's rate limits).
+_INFLIGHT: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+
+
+async def _scrape_and_cache(imo: str) -> Dict[str, Any]:
+    data = await scrape_vf_full(imo, HTTP_CLIENT)
+    if data.get("found"):
+        _VESSEL_CACHE[imo] = data
+    else:
+        _NOT_FOUND_CACHE[imo] = data
+    return data
+
+
+async def get_vessel_cached(imo: str) -> Dict[str, Any]:
+    """scrape_vf_full with a TTL cache and request coalescing, keyed by IMO."""
+    cached = _VESSEL_CACHE.get(imo)
+    if cached is not None:
+        logger.info(f"IMO {imo} | cache hit (ttl={VESSEL_CACHE_TTL}s)")
+        return cached
+
+    not_found = _NOT_FOUND_CACHE.get(imo)
+    if not_found is not None:
+        logger.info(f"IMO {imo} | negative-cache hit")
+        return not_found
+
+    pending = _INFLIGHT.get(imo)
+    if pending is not None:
+        logger.info(f"IMO {imo} | joining in-flight scrape")
+    else:
+        # The scrape runs as its own task, detached from this request:
+        # if the client that triggered it disconnects, uvicorn cancels
+        # only this coroutine's shielded await — the shared scrape
+        # finishes and the coalesced waiters still get their result.
+        pending = asyncio.get_running_loop().create_task(_scrape_and_cache(imo))
+        _INFLIGHT[imo] = pending
+        pending.add_done_callback(
+            lambda t, imo=imo: _inflight_done(_INFLIGHT, imo, t)
+        )
+    return await asyncio.shield(pending)
+
 # ============================================================
 # API ENDPOINTS
 # ============================================================
@@ -994,24 +1536,86 @@ def ping():
     return {"ok": True}
 
 @app.get("/vessel-full/{imo}")
-def vessel_full(imo: str, request: Request):
+async def vessel_full(imo: str, request: Request):
     _check_auth(request, imo)
 
     if not validate_imo(imo):
         logger.warning(f"Invalid IMO rejected: {imo}")
         raise HTTPException(status_code=400, detail="Invalid IMO number")
 
-    with requests.Session() as session:
-        try:
-            data = scrape_vf_full(imo, session)
-        except Exception as e:
-            logger.error(f"Scrape failed for IMO {imo}: {e}", exc_info=True)
-            raise HTTPException(status_code=502, detail="Upstream scrape failed")
+    try:
+        data = await get_vessel_cached(imo)
+    except Exception as e:
+        logger.error(f"Scrape failed for IMO {imo}: {e}", exc_info=True)
+        raise HTTPException(status_code=502, detail="Upstream scrape failed")
 
     if not data.get("found"):
         raise HTTPException(status_code=404, detail="Vessel not found")
 
-    return data
+    return _JSON_RESPONSE(data)
+
+@app.get("/vessel-pos/{imo}")
+@app.get("/vessel-ais/{imo}")   # alias — some clients know it by this name
+async def vessel_pos(imo: str, request: Request):
+    """
+    Position-only fast path. When the IMO→MMSI mapping is already cached
+    (any prior full scrape populates it), this queries only the cheap
+    position tiers and never touches the VF page — the dominant cost of
+    /vessel-full. Falls back to the full scrape on a cold IMO or when no
+    tier returns a fix.
+    """
+    _check_auth(request, imo)
+
+    if not validate_imo(imo):
+        logger.warning(f"Invalid IMO rejected: {imo}")
+        raise HTTPException(status_code=400, detail="Invalid IMO number")
+
+    mmsi = _IMO_MMSI_CACHE.get(imo)
+    if mmsi:
+        candidates: List[Dict[str, Any]] = []
+        for cand in await asyncio.gather(
+            asyncio.to_thread(get_myshiptracking_pos_vessel_api, mmsi),
+            asyncio.to_thread(get_hifleet_position, mmsi),
+            return_exceptions=True,
+        ):
+            if isinstance(cand, BaseException):
+                logger.debug(f"MMSI {mmsi} | cheap position tier failed: {cand}")
+                continue
+            if cand and cand.get("lat") is not None:
+                candidates.append(cand)
+        best = pick_best_position(candidates, f"IMO {imo} (pos-only)")
+        if best:
+            return _JSON_RESPONSE({
+                "imo":          imo,
+                "mmsi":         mmsi,
+                "lat":          best.get("lat"),
+                "lon":          best.get("lon"),
+                "sog":          best.get("sog"),
+                "cog":          best.get("cog"),
+                "last_pos_utc": best.get("last_pos_utc"),
+                "ais_source":   best.get("ais_source"),
+            })
+        logger.info(f"IMO {imo} | pos-only tiers empty — falling back to full scrape")
+
+    try:
+        data = await get_vessel_cached(imo)
+    except Exception as e:
+        logger.error(f"Scrape failed for IMO {imo}: {e}", exc_info=True)
+        raise HTTPException(status_code=502, detail="Upstream scrape failed")
+
+    if not data.get("found"):
+        raise HTTPException(status_code=404, detail="Vessel not found")
+
+    return _JSON_RESPONSE({
+        "imo":          imo,
+        "mmsi":         data.get("mmsi"),
+        "lat":          data.get("lat"),
+        "lon":          data.get("lon"),
+        "sog":          data.get("sog"),
+        "cog":          data.get("cog"),
+        "last_pos_utc": data.get("last_pos_utc"),
+        "ais_source":   data.get("ais_source"),
+    })
 
 @app.get("/equasis/{imo}")
 def equasis_endpoint(imo: str, request: Request):
@@ -1089,7 +1693,7 @@ def port_calls_endpoint(imo: str, request: Request, mmsi: str = ""):
 
 
 @app.post("/vessel-batch")
-def vessel_batch(body: BatchRequest, request: Request):
+async def vessel_batch(body: BatchRequest, request: Request):
     _check_auth(request)
 
     imos = list(dict.fromkeys(body.imos))
@@ -1107,28 +1711,29 @@ def vessel_batch(body: BatchRequest, request: Request):
     results: Dict[str, Any] = {}
     errors:  Dict[str, str] = {}
 
-    def fetch_one(imo: str) -> tuple:
-        try:
-            time.sleep(random.uniform(2, 5))
-            with requests.Session() as session:
-                data = scrape_vf_full(imo, session)
-            if not data.get("found"):
-                return imo, None, "Vessel not found"
-            return imo, data, None
-        except Exception as e:
-            logger.error(f"Batch scrape failed for IMO {imo}: {e}")
-            return imo, None, str(e)
+    # Same politeness throttle as the old thread pool: at most
+    # BATCH_MAX_WORKERS scrapes in flight, jittered start per vessel.
+    batch_sem = asyncio.Semaphore(BATCH_MAX_WORKERS)
+
+    async def fetch_one(imo: str) -> tuple:
+        async with batch_sem:
+            try:
+                await asyncio.sleep(random.uniform(2, 5))
+                data = await get_vessel_cached(imo)
+                if not data.get("found"):
+                    return imo, None, "Vessel not found"
+                return imo, data, None
+            except Exception as e:
+                logger.error(f"Batch scrape failed for IMO {imo}: {e}")
+                return imo, None, str(e)
 
     logger.info(f"Batch request: {len(imos)} vessels, {BATCH_MAX_WORKERS} workers")
 
-    with ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS) as executor:
-        futures = {executor.submit(fetch_one, imo): imo for imo in imos}
-        for future in as_completed(futures):
-            imo, data, error = future.result()
-            if error:
-                errors[imo] = error
-            else:
-                results[imo] = data
+    for imo, data, error in await asyncio.gather(*(fetch_one(imo) for imo in imos)):
+        if error:
+            errors[imo] = error
+        else:
+            results[imo] = data
 
     logger.info(f"Batch complete: {len(results)} success, {len(errors)} errors")
 
@@ -1156,7 +1761,7 @@ def _equasis_session() -> requests.Session:
     # Step 1: GET the public homepage to establish JSESSIONID + grab CSRF token
     login_page = session.get(EQUASIS_HOMEPAGE_URL, timeout=15)
     login_page.raise_for_status()
-    login_soup = BeautifulSoup(login_page.text, "html.parser")
+    login_soup = BeautifulSoup(login_page.text, "lxml")
     token_input = login_soup.find("input", {"name": "j_token"})
     token = token_input["value"] if token_input else ""
 
@@ -1189,7 +1794,7 @@ def _scrape_equasis(imo: str, session: requests.Session) -> Dict[str, Any]:
         # We raise a custom error so your loop can catch it and re-login
         raise ConnectionRefusedError(f"Equasis session expired or IP blocked (Response size: {len(resp.text)}b)")
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+    soup = BeautifulSoup(resp.text, "lxml")
 
     # ─────────────────────────────────────────────────────────────────────
     # Vessel name — Robust extraction